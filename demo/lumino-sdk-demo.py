@@ -9,17 +9,47 @@
 
 import asyncio
 import os
+import random
 import time
 
 from lumino.api_sdk.models import FineTuningJobParameters, FineTuningJobCreate, DatasetCreate, FineTuningJobType, \
     ComputeProvider, FineTuningJobStatus
 from lumino.api_sdk.sdk import LuminoSDK
 
+# Polling backoff settings, in seconds
+POLL_BASE_DELAY = 5
+POLL_MAX_DELAY = 60
+
+TERMINAL_STATUSES = {
+    FineTuningJobStatus.COMPLETED,
+    FineTuningJobStatus.FAILED,
+    FineTuningJobStatus.STOPPED,
+    FineTuningJobStatus.DELETED
+}
+
+
+async def poll_until_complete(client, job_name):
+    """
+    Poll a fine-tuning job until it reaches a terminal status.
+
+    Uses exponential backoff with full jitter; the backoff resets whenever the job status changes.
+    """
+    attempt = 0
+    job = await client.fine_tuning.get_fine_tuning_job(job_name)
+    while job.status not in TERMINAL_STATUSES:
+        await asyncio.sleep(random.uniform(0, min(POLL_MAX_DELAY, POLL_BASE_DELAY * 2 ** attempt)))
+        last_status = job.status
+        job = await client.fine_tuning.get_fine_tuning_job(job_name)
+        print("\n=== Fine-tuning job details: ===")
+        print(job)
+        attempt = 0 if job.status != last_status else attempt + 1
+    return job
+
 
 async def main():
     print("Starting Lumino SDK demo...")
 
-    suffix = str(int(time.time()) % 10000)  # 4 digit random number
+    suffix = f"{time.monotonic_ns() & 0xFFFF:04x}"  # 4 hex digit time-based suffix
     dataset_name = "text2sql-" + suffix
 
     async with LuminoSDK(os.environ.get("LUMSDK_API_KEY")) as client:
@@ -51,11 +81,7 @@ async def main():
         print(job)
 
         # Monitor the fine-tuning job
-        while job.status != FineTuningJobStatus.COMPLETED:
-            job = await client.fine_tuning.get_fine_tuning_job(job.name)
-            print("\n=== Fine-tuning job details: ===")
-            print(job)
-            await asyncio.sleep(5)
+        await poll_until_complete(client, job.name)
 
         print("Done!")
 
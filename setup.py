@@ -27,4 +27,5 @@ setup(
     package_dir={"": "src"},
     python_requires=">=3.10",
     install_requires=requirements,
+    extras_require={"speedups": ["orjson"]},
 )
\ No newline at end of file
@@ -41,7 +41,7 @@ class ApiKeyEndpoint:
             LuminoValidationError: If the provided data is invalid.
         """
         self.logger.info("Creating new API key: %s", api_key_create.name)
-        data = await self._sdk.request("POST", "/api-keys", json=api_key_create.model_dump())
+        data = await self._sdk.request_model("POST", "/api-keys", api_key_create)
         return ApiKeyWithSecretResponse(**data)
 
     async def list_api_keys(self, page: int = 1, items_per_page: int = 20) -> ListResponse:
@@ -61,7 +61,7 @@ class ApiKeyEndpoint:
         self.logger.info("Listing API keys (page %d)", page)
         params = {"page": page, "items_per_page": items_per_page}
         data = await self._sdk.request("GET", "/api-keys", params=params)
-        return ListResponse(
+        return ListResponse.model_construct(
             data=[ApiKeyResponse(**item) for item in data['data']],
             pagination=Pagination(**data['pagination'])
         )
@@ -99,10 +99,11 @@ class ApiKeyEndpoint:
             LuminoValidationError: If the provided data is invalid.
         """
         self.logger.info("Updating API key: %s", key_name)
-        data = await self._sdk.request(
+        data = await self._sdk.request_model(
             "PATCH",
             f"/api-keys/{key_name}",
-            json=api_key_update.model_dump(exclude_unset=True)
+            api_key_update,
+            exclude_unset=True
         )
         return ApiKeyResponse(**data)
 
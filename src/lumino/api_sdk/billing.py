@@ -58,7 +58,7 @@ class BillingEndpoint:
             "items_per_page": items_per_page
         }
         data = await self._sdk.request("GET", "/billing/credit-history", params=params)
-        return ListResponse(
+        return ListResponse.model_construct(
             data=[CreditHistoryResponse(**item) for item in data['data']],
             pagination=Pagination(**data['pagination'])
         )
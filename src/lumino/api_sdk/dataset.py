@@ -1,4 +1,6 @@
 import logging
+import os
+from typing import BinaryIO
 
 import aiohttp
 
@@ -11,6 +13,9 @@ from lumino.api_sdk.models import (
 )
 from lumino.api_sdk.sdk import LuminoSDK
 
+# File name used when uploading a file-like object that has no name
+DEFAULT_DATASET_FILE_NAME = "dataset.jsonl"
+
 
 class DatasetEndpoint:
     """
@@ -27,12 +32,15 @@ class DatasetEndpoint:
         self._sdk = sdk
         self.logger = logging.getLogger(__name__)
 
-    async def upload_dataset(self, file_path: str, dataset_create: DatasetCreate) -> DatasetResponse:
+    async def upload_dataset(self, file_path: str | os.PathLike | BinaryIO,
+                             dataset_create: DatasetCreate) -> DatasetResponse:
         """
         Upload a new dataset.
 
         Args:
-            file_path (str): The path to the dataset file.
+            file_path (str | os.PathLike | BinaryIO): The path to the dataset file, or a binary
+                file-like object with the dataset contents. File-like objects without a `name`
+                are uploaded as "dataset.jsonl".
             dataset_create (DatasetCreate): The dataset creation data.
 
         Returns:
@@ -44,20 +52,37 @@ class DatasetEndpoint:
             FileNotFoundError: If the specified file does not exist.
         """
         self.logger.info("Uploading dataset: %s", dataset_create.name)
+        if not isinstance(file_path, (str, os.PathLike)):
+            return await self._upload_dataset_file(file_path, dataset_create)
+
         try:
             with open(file_path, 'rb') as file:
-                data = aiohttp.FormData()
-                data.add_field('file', file)
-                data.add_field('name', dataset_create.name)
-                if dataset_create.description:
-                    data.add_field('description', dataset_create.description)
-
-                response_data = await self._sdk.request("POST", "/datasets", data=data)
-                return DatasetResponse(**response_data)
+                return await self._upload_dataset_file(file, dataset_create)
         except FileNotFoundError:
             self.logger.error("File not found: %s", file_path)
             raise
 
+    async def _upload_dataset_file(self, file: BinaryIO, dataset_create: DatasetCreate) -> DatasetResponse:
+        """
+        Upload the contents of an open dataset file.
+
+        Args:
+            file (BinaryIO): The dataset file object.
+            dataset_create (DatasetCreate): The dataset creation data.
+
+        Returns:
+            DatasetResponse: The uploaded dataset information.
+        """
+        data = aiohttp.FormData()
+        # Let aiohttp derive the file name from named files
+        data.add_field('file', file, filename=None if hasattr(file, 'name') else DEFAULT_DATASET_FILE_NAME)
+        data.add_field('name', dataset_create.name)
+        if dataset_create.description:
+            data.add_field('description', dataset_create.description)
+
+        response_data = await self._sdk.request("POST", "/datasets", data=data)
+        return DatasetResponse(**response_data)
+
     async def list_datasets(self, page: int = 1, items_per_page: int = 20) -> ListResponse:
         """
         List all datasets.
@@ -75,7 +100,7 @@ class DatasetEndpoint:
         self.logger.info("Listing datasets (page %d)", page)
         params = {"page": page, "items_per_page": items_per_page}
         data = await self._sdk.request("GET", "/datasets", params=params)
-        return ListResponse(
+        return ListResponse.model_construct(
             data=[DatasetResponse(**item) for item in data['data']],
             pagination=Pagination(**data['pagination'])
         )
@@ -113,10 +138,11 @@ class DatasetEndpoint:
             LuminoValidationError: If the provided data is invalid.
         """
         self.logger.info("Updating dataset: %s", dataset_name)
-        data = await self._sdk.request(
+        data = await self._sdk.request_model(
             "PATCH",
             f"/datasets/{dataset_name}",
-            json=dataset_update.model_dump(exclude_unset=True)
+            dataset_update,
+            exclude_unset=True
         )
         return DatasetResponse(**data)
 
@@ -41,7 +41,7 @@ class FineTuningEndpoint:
             LuminoValidationError: If the provided data is invalid.
         """
         self.logger.info("Creating fine-tuning job: %s", job_create.name)
-        data = await self._sdk.request("POST", "/fine-tuning", json=job_create.model_dump())
+        data = await self._sdk.request_model("POST", "/fine-tuning", job_create)
         return FineTuningJobResponse(**data)
 
     async def list_fine_tuning_jobs(self, page: int = 1, items_per_page: int = 20,
@@ -65,7 +65,7 @@ class FineTuningEndpoint:
         if status:
             params["status"] = status
         data = await self._sdk.request("GET", "/fine-tuning", params=params)
-        return ListResponse(
+        return ListResponse.model_construct(
             data=[FineTuningJobResponse(**item) for item in data['data']],
             pagination=Pagination(**data['pagination'])
         )
@@ -41,7 +41,7 @@ class ModelEndpoint:
         self.logger.info("Listing base models (page %d)", page)
         params = {"page": page, "items_per_page": items_per_page}
         data = await self._sdk.request("GET", "/models/base", params=params)
-        return ListResponse(
+        return ListResponse.model_construct(
             data=[BaseModelResponse(**item) for item in data['data']],
             pagination=Pagination(**data['pagination'])
         )
@@ -80,7 +80,7 @@ class ModelEndpoint:
         self.logger.info("Listing fine-tuned models (page %d)", page)
         params = {"page": page, "items_per_page": items_per_page}
         data = await self._sdk.request("GET", "/models/fine-tuned", params=params)
-        return ListResponse(
+        return ListResponse.model_construct(
             data=[FineTunedModelResponse(**item) for item in data['data']],
             pagination=Pagination(**data['pagination'])
         )
@@ -126,7 +126,12 @@ class Pagination(BaseModel):
 
 
 class ListResponse(BaseModel):
-    """Model for list response data."""
+    """
+    Model for list response data.
+
+    Endpoints build this with `model_construct`: the items and pagination are
+    validated individually, so validating the wrapper again is redundant.
+    """
     data: List[Any]
     pagination: Pagination
 
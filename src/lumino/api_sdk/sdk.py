@@ -4,9 +4,22 @@ from datetime import datetime
 from typing import Dict, Any
 
 import aiohttp
+from pydantic import BaseModel as PydanticBaseModel
 
 from lumino.api_sdk.exceptions import LuminoServerError
 
+try:
+    # Optional faster JSON decoder, installed with the `speedups` extra
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+# Connection pool settings for the shared aiohttp session.
+# The SDK only talks to the API host, so this caps concurrent connections to it.
+MAX_CONNECTIONS = 20
+# Long enough to keep connections open between job status polls
+KEEPALIVE_TIMEOUT = 75.0
+
 
 class DateTimeEncoder(json.JSONEncoder):
     """Custom JSON encoder for datetime objects."""
@@ -78,9 +91,15 @@ class LuminoSDK:
             self.session = None
 
     async def _ensure_session(self) -> None:
-        """Ensure that an aiohttp session exists."""
+        """
+        Ensure that an aiohttp session exists.
+
+        The session owns a keep-alive connection pool that is reused by every
+        endpoint call until the async context exits.
+        """
         if self.session is None:
-            self.session = aiohttp.ClientSession(headers={"X-API-Key": self.api_key})
+            connector = aiohttp.TCPConnector(limit=MAX_CONNECTIONS, keepalive_timeout=KEEPALIVE_TIMEOUT)
+            self.session = aiohttp.ClientSession(headers={"X-API-Key": self.api_key}, connector=connector)
 
     async def request(self, method: str, endpoint: str, **kwargs: Any) -> Dict[str, Any]:
         """
@@ -110,10 +129,35 @@ class LuminoSDK:
             async with self.session.request(method, url, **kwargs) as response:  # type: ignore
                 if response.status >= 400:
                     await self._handle_error_response(response)
-                return await response.json()
+                return await response.json(loads=json_loads)
         except aiohttp.ClientResponseError as e:
             raise LuminoServerError(e.status, str(e))
 
+    async def request_model(self, method: str, endpoint: str, body: PydanticBaseModel,
+                            exclude_unset: bool = False, **kwargs: Any) -> Dict[str, Any]:
+        """
+        Make an HTTP request to the Lumino API with a request model as the JSON body.
+
+        The model is serialized by pydantic's JSON encoder, skipping the intermediate dict.
+
+        Args:
+            method (str): The HTTP method to use (e.g., "POST", "PATCH").
+            endpoint (str): The API endpoint to call.
+            body (PydanticBaseModel): The request model to send.
+            exclude_unset (bool): Whether to leave out fields that were not explicitly set.
+            **kwargs: Additional keyword arguments to pass to the request.
+
+        Returns:
+            Dict[str, Any]: The JSON response from the API.
+
+        Raises:
+            LuminoAPIError: If the API request fails.
+        """
+        kwargs['data'] = body.model_dump_json(exclude_unset=exclude_unset)
+        kwargs['headers'] = kwargs.get('headers', {})
+        kwargs['headers']['Content-Type'] = 'application/json'
+        return await self.request(method, endpoint, **kwargs)
+
     @staticmethod
     async def _handle_error_response(response: aiohttp.ClientResponse) -> None:
         """
@@ -126,7 +170,7 @@ class LuminoSDK:
             LuminoAPIError: With detailed error information.
         """
         try:
-            error_data = await response.json()
+            error_data = await response.json(loads=json_loads)
         except json.JSONDecodeError:
             error_data = await response.text()
 
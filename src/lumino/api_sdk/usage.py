@@ -86,7 +86,7 @@ class UsageEndpoint:
             params["service_name"] = service_name
 
         data = await self._sdk.request("GET", "/usage/records", params=params)
-        return ListResponse(
+        return ListResponse.model_construct(
             data=[UsageRecordResponse(**item) for item in data['data']],
             pagination=Pagination(**data['pagination'])
         )
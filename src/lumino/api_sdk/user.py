@@ -48,9 +48,10 @@ class UserEndpoint:
             LuminoValidationError: If the provided data is invalid.
         """
         self.logger.info("Updating current user information")
-        data = await self._sdk.request(
+        data = await self._sdk.request_model(
             "PATCH",
             "/users/me",
-            json=user_update.model_dump(exclude_unset=True)
+            user_update,
+            exclude_unset=True
         )
         return UserResponse(**data)
@@ -1,3 +1,4 @@
+import json
 from datetime import datetime, timedelta, timezone
 from unittest.mock import patch
 
@@ -125,6 +126,28 @@ async def test_update_api_key(sdk, mock_response):
             assert api_key.status == ApiKeyStatus.ACTIVE
 
 
+@pytest.mark.asyncio
+async def test_update_api_key_request_body(sdk, mock_response):
+    """Test that only the set fields are sent as a JSON body."""
+    mock_response.json.return_value = {
+        "id": "123e4567-e89b-12d3-a456-426614174000",
+        "created_at": "2024-01-01T00:00:00Z",
+        "last_used_at": None,
+        "expires_at": "2024-03-01T00:00:00Z",
+        "status": "ACTIVE",
+        "name": "updated-key",
+        "prefix": "lum_"
+    }
+
+    with patch.object(aiohttp.ClientSession, 'request', return_value=mock_response) as mock_request:
+        async with sdk:
+            await sdk.api_keys.update_api_key("test-key", ApiKeyUpdate(name="updated-key"))
+
+    _, kwargs = mock_request.call_args
+    assert json.loads(kwargs['data']) == {"name": "updated-key"}
+    assert kwargs['headers']['Content-Type'] == 'application/json'
+
+
 @pytest.mark.asyncio
 async def test_revoke_api_key(sdk, mock_response):
     """Test API key revocation."""
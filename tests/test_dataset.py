@@ -1,3 +1,4 @@
+import io
 from unittest.mock import patch, mock_open
 
 import aiohttp
@@ -41,6 +42,66 @@ async def test_dataset_operations(sdk, mock_response):
             assert dataset.status == DatasetStatus.VALIDATED
 
 
+@pytest.mark.asyncio
+async def test_dataset_upload_from_buffer(sdk, mock_response):
+    """Test dataset upload from an in-memory file object."""
+    mock_response.json.return_value = {
+        "id": "123e4567-e89b-12d3-a456-426614174000",
+        "created_at": "2024-01-01T00:00:00Z",
+        "updated_at": "2024-01-01T00:00:00Z",
+        "status": "UPLOADED",
+        "name": "test-dataset",
+        "description": None,
+        "file_name": "dataset.jsonl",
+        "file_size": 16,
+        "errors": None
+    }
+
+    with patch.object(aiohttp.ClientSession, 'request', return_value=mock_response), \
+            patch.object(aiohttp.FormData, 'add_field', autospec=True,
+                         side_effect=aiohttp.FormData.add_field) as mock_add_field:
+        async with sdk:
+            dataset = await sdk.dataset.upload_dataset(
+                io.BytesIO(b'{"test": "data"}'),
+                DatasetCreate(name="test-dataset")
+            )
+            assert isinstance(dataset, DatasetResponse)
+            assert dataset.status == DatasetStatus.UPLOADED
+
+    file_call = next(c for c in mock_add_field.call_args_list if c.args[1] == 'file')
+    assert file_call.kwargs['filename'] == "dataset.jsonl"
+
+
+@pytest.mark.asyncio
+async def test_dataset_upload_from_path(sdk, mock_response, tmp_path):
+    """Test dataset upload from a pathlib.Path sends the file contents."""
+    mock_response.json.return_value = {
+        "id": "123e4567-e89b-12d3-a456-426614174000",
+        "created_at": "2024-01-01T00:00:00Z",
+        "updated_at": "2024-01-01T00:00:00Z",
+        "status": "UPLOADED",
+        "name": "test-dataset",
+        "description": None,
+        "file_name": "test.jsonl",
+        "file_size": 16,
+        "errors": None
+    }
+    dataset_path = tmp_path / "test.jsonl"
+    dataset_path.write_bytes(b'{"test": "data"}')
+
+    with patch.object(aiohttp.ClientSession, 'request', return_value=mock_response), \
+            patch.object(aiohttp.FormData, 'add_field', autospec=True,
+                         side_effect=aiohttp.FormData.add_field) as mock_add_field:
+        async with sdk:
+            dataset = await sdk.dataset.upload_dataset(dataset_path, DatasetCreate(name="test-dataset"))
+            assert isinstance(dataset, DatasetResponse)
+
+    file_call = next(c for c in mock_add_field.call_args_list if c.args[1] == 'file')
+    file = file_call.args[2]
+    assert file.name == str(dataset_path)
+    assert file.mode == 'rb'
+
+
 @pytest.mark.asyncio
 async def test_dataset_file_not_found(sdk):
     """Test dataset upload with non-existent file."""
@@ -1,15 +1,19 @@
 import os
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Optional, TYPE_CHECKING
 
-from dotenv import load_dotenv
-from rich.console import Console
+if TYPE_CHECKING:
+    from rich.console import Console
 
 # Get project root directory
 ROOT_DIR = Path(__file__).parent.resolve()
 TEMP_DIR = ROOT_DIR / ".temp"
 
+VALID_LOG_LEVELS = frozenset({"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"})
+TRUTHY_VALUES = frozenset({"true", "yes", "on", "1"})
+
 
 def is_truthy(value: str | bool) -> bool:
     """
@@ -22,7 +26,7 @@ def is_truthy(value: str | bool) -> bool:
         True if value is truthy, False otherwise
     """
     if isinstance(value, str):
-        return value.lower() in ['true', 'yes', 'on', '1']
+        return value.lower() in TRUTHY_VALUES
     elif isinstance(value, bool):
         return value
     return False
@@ -40,6 +44,7 @@ class Config:
     log_level: str = "INFO"
     temp_dir: Path = TEMP_DIR
     fine_tuning_base_model: str = "llm_dummy"
+    thorough_checks: bool = False
 
     @classmethod
     def load(cls, env_file: Optional[str] = None) -> 'Config':
@@ -55,6 +60,8 @@ class Config:
         Raises:
             ValueError: If required settings are missing
         """
+        from dotenv import load_dotenv
+
         # Load .env file if provided or exists in root directory
         if env_file:
             load_dotenv(env_file)
@@ -77,7 +84,8 @@ class Config:
             api_url=os.getenv("LUMSDK_BASE_URL", cls.api_url),
             run_with_scheduler=is_truthy(os.getenv("E2E_TESTS_RUN_WITH_SCHEDULER", cls.run_with_scheduler)),
             log_level=os.getenv("E2E_TESTS_LOG_LEVEL", cls.log_level),
-            fine_tuning_base_model=os.getenv("E2E_TESTS_FINE_TUNING_BASE_MODEL", cls.fine_tuning_base_model)
+            fine_tuning_base_model=os.getenv("E2E_TESTS_FINE_TUNING_BASE_MODEL", cls.fine_tuning_base_model),
+            thorough_checks=is_truthy(os.getenv("E2E_TESTS_THOROUGH_CHECKS", cls.thorough_checks))
         )
 
     def validate(self) -> None:
@@ -96,9 +104,8 @@ class Config:
             raise ValueError("API URL must start with http:// or https://")
 
         # Validate log level
-        valid_log_levels = {"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"}
-        if self.log_level.upper() not in valid_log_levels:
-            raise ValueError(f"Log level must be one of: {', '.join(valid_log_levels)}")
+        if self.log_level.upper() not in VALID_LOG_LEVELS:
+            raise ValueError(f"Log level must be one of: {', '.join(sorted(VALID_LOG_LEVELS))}")
 
         # Validate temp directory
         if not self.temp_dir.exists():
@@ -108,20 +115,22 @@ class Config:
         """Validate configuration after initialization."""
         self.validate()
 
-    def log_config(self, console: Console) -> None:
+    def log_config(self, console: 'Console') -> None:
         """Print the configuration settings."""
         console.print("\n=== Configuration Settings ===")
         console.print(f"API URL: {self.api_url}")
         console.print(f"Run with scheduler: {self.run_with_scheduler}")
         console.print(f"Log Level: {self.log_level}")
         console.print(f"Temp Directory: {self.temp_dir}")
-        console.print(f"Fine-tuning Base Model: {self.fine_tuning_base_model}\n")
+        console.print(f"Fine-tuning Base Model: {self.fine_tuning_base_model}")
+        console.print(f"Thorough checks: {self.thorough_checks}\n")
 
 
-# Global configuration instance
-_config: Optional[Config] = None
+# Optional .env file used when loading the global configuration
+_env_file: Optional[str] = None
 
 
+@lru_cache(maxsize=1)
 def get_config() -> Config:
     """
     Get the global configuration instance, creating it if necessary.
@@ -129,10 +138,7 @@ def get_config() -> Config:
     Returns:
         Config object with current settings
     """
-    global _config
-    if _config is None:
-        _config = Config.load()
-    return _config
+    return Config.load(_env_file)
 
 
 def initialize_config(env_file: Optional[str] = None) -> Config:
@@ -148,9 +154,10 @@ def initialize_config(env_file: Optional[str] = None) -> Config:
     Note:
         This will replace any existing configuration.
     """
-    global _config
-    _config = Config.load(env_file)
-    return _config
+    global _env_file
+    _env_file = env_file
+    get_config.cache_clear()
+    return get_config()
 
 
 if __name__ == "__main__":
@@ -163,5 +170,6 @@ if __name__ == "__main__":
         print(f"Log Level: {config.log_level}")
         print(f"Temp Directory: {config.temp_dir}")
         print(f"Fine-tuning Base Model: {config.fine_tuning_base_model}")
+        print(f"Thorough checks: {config.thorough_checks}")
     except ValueError as e:
         print(f"Configuration error: {e}")
@@ -0,0 +1,45 @@
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+import pytest_asyncio
+
+# E2E modules import each other as top-level modules
+E2E_DIR = Path(__file__).parent
+sys.path.insert(0, str(E2E_DIR))
+
+from logger import get_logger  # noqa: E402
+from test_runner import TestRunner, get_shared_runner, close_shared_runner  # noqa: E402
+# Imported through the package, as pytest does, so they don't clash with same-named unit test modules
+from tests_e2e.test_api_keys import cleanup_api_keys  # noqa: E402
+from tests_e2e.test_datasets import cleanup_datasets  # noqa: E402
+from tests_e2e.test_fine_tuning import cleanup_fine_tuning  # noqa: E402
+from tests_e2e.test_users import cleanup_user_operations  # noqa: E402
+
+logger = get_logger(__name__)
+
+# Remove whatever the tests created, even when a test failed part way through
+CLEANUPS = (cleanup_api_keys, cleanup_datasets, cleanup_fine_tuning, cleanup_user_operations)
+
+
+def pytest_collection_modifyitems(items):
+    """Run the E2E tests in the session event loop that owns the shared runner."""
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if item.path.is_relative_to(E2E_DIR) and pytest_asyncio.is_async_test(item):
+            item.add_marker(session_loop, append=False)
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def runner() -> TestRunner:
+    """Shared TestRunner with an open SDK session for the whole test session."""
+    shared_runner = await get_shared_runner()
+    yield shared_runner
+    try:
+        results = await asyncio.gather(*[cleanup(shared_runner) for cleanup in CLEANUPS], return_exceptions=True)
+        for cleanup, result in zip(CLEANUPS, results):
+            if isinstance(result, Exception):
+                logger.warning("%s failed: %s", cleanup.__name__, result)
+    finally:
+        await close_shared_runner()
@@ -1,5 +1,6 @@
 import logging
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -7,11 +8,42 @@ from rich.logging import RichHandler
 
 from config import get_config
 
+CONSOLE_FORMAT = "%(message)s"
+FILE_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 
+# Console handler with rich formatting, shared by all loggers
+_console_handler = RichHandler(
+    rich_tracebacks=True,
+    show_time=False,
+    show_path=False
+)
+_console_handler.setFormatter(logging.Formatter(CONSOLE_FORMAT))
+
+# File handlers, shared by all loggers writing to the same file
+_file_handlers: dict[str, logging.FileHandler] = {}
+
+
+def _get_file_handler(log_file: str) -> logging.FileHandler:
+    """Get or create the file handler for the given log file."""
+    handler = _file_handlers.get(log_file)
+    if handler is None:
+        # Create logs directory if needed
+        Path(log_file).parent.mkdir(parents=True, exist_ok=True)
+
+        handler = logging.FileHandler(log_file)
+        handler.setFormatter(logging.Formatter(FILE_FORMAT))
+        _file_handlers[log_file] = handler
+    return handler
+
+
+@lru_cache(maxsize=None)
 def get_logger(name: str, log_file: Optional[str] = None) -> logging.Logger:
     """
     Get or create a logger with the specified name and configuration.
 
+    Loggers are configured once; calling again with a different log_file
+    for the same name does not add a file handler.
+
     Args:
         name: Logger name (typically __name__ of the calling module)
         log_file: Optional file path for logging output. If None, logs only to console.
@@ -32,28 +64,11 @@ def get_logger(name: str, log_file: Optional[str] = None) -> logging.Logger:
     # Set log level from configuration
     logger.setLevel(config.log_level)
 
-    # Create formatters
-    console_format = "%(message)s"
-    file_format = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-
-    # Console handler with rich formatting
-    console_handler = RichHandler(
-        rich_tracebacks=True,
-        show_time=False,
-        show_path=False
-    )
-    console_handler.setFormatter(logging.Formatter(console_format))
-    logger.addHandler(console_handler)
+    logger.addHandler(_console_handler)
 
     # File handler if log file specified
     if log_file:
-        # Create logs directory if needed
-        log_path = Path(log_file)
-        log_path.parent.mkdir(parents=True, exist_ok=True)
-
-        file_handler = logging.FileHandler(log_file)
-        file_handler.setFormatter(logging.Formatter(file_format))
-        logger.addHandler(file_handler)
+        logger.addHandler(_get_file_handler(log_file))
 
     # Don't propagate to root logger
     logger.propagate = False
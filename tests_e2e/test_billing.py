@@ -1,16 +1,16 @@
 import asyncio
+from collections import defaultdict
 from datetime import date, timedelta
 from typing import TYPE_CHECKING
 
 from logger import get_logger
 from lumino.api_sdk.models import BillingTransactionType
-from utils import TestData
+from utils import test_data
 
 if TYPE_CHECKING:
     from test_runner import TestRunner
 
 logger = get_logger(__name__)
-test_data = TestData()
 
 
 async def test_billing_operations(runner: 'TestRunner') -> None:
@@ -43,26 +43,24 @@ async def test_billing_operations(runner: 'TestRunner') -> None:
 
     # Analyze transactions if any exist
     if credit_history.data:
-        # Group transactions by type
-        transactions_by_type = {}
+        # Verify each transaction and accumulate [count, total credits] per type
+        totals_by_type = defaultdict(lambda: [0, 0.0])
         for record in credit_history.data:
-            transactions_by_type.setdefault(record.transaction_type, []).append(record)
+            assert record.transaction_type in BillingTransactionType, \
+                f"Invalid transaction type: {record.transaction_type}"
+            assert isinstance(record.credits, (int, float)), \
+                f"Invalid credits value: {record.credits}"
+            totals = totals_by_type[record.transaction_type]
+            totals[0] += 1
+            totals[1] += record.credits
 
         # Log summary by type
-        for tx_type, records in transactions_by_type.items():
-            total_credits = sum(r.credits for r in records)
+        for tx_type, (count, total_credits) in totals_by_type.items():
             logger.info(
-                f"{tx_type}: {len(records)} transactions, "
+                f"{tx_type}: {count} transactions, "
                 f"total credits: {total_credits:+.2f}"
             )
 
-        # Verify all transaction types are valid
-        for record in credit_history.data:
-            assert record.transaction_type in BillingTransactionType, \
-                f"Invalid transaction type: {record.transaction_type}"
-            assert isinstance(record.credits, (int, float)), \
-                f"Invalid credits value: {record.credits}"
-
     # Test pagination
     page_2 = await runner.sdk.billing.get_credit_history(
         start_date,
@@ -123,16 +121,15 @@ async def verify_credit_transaction(
 
 if __name__ == "__main__":
     # For manual testing of these modules
-    from test_runner import TestRunner
+    from test_runner import get_shared_runner, close_shared_runner
 
 
     async def run_test():
-        runner = TestRunner()
+        runner = await get_shared_runner()
         try:
-            await runner.setup()
             await test_billing_operations(runner)
         finally:
-            await runner.cleanup()
+            await close_shared_runner()
 
 
     asyncio.run(run_test())
@@ -1,20 +1,28 @@
 import asyncio
+import io
 import json
+import logging
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Final
 
 from config import get_config
 from logger import get_logger
 from lumino.api_sdk.models import DatasetCreate, DatasetUpdate, DatasetStatus
-from utils import TestData, generate_test_name, sanitize_name, format_size
+from utils import test_data, generate_test_name, sanitize_name, format_size
 
 if TYPE_CHECKING:
     from test_runner import TestRunner
 
+try:
+    # Optional faster JSON encoder, installed with the SDK's `speedups` extra
+    from orjson import dumps as json_dumps
+except ImportError:
+    def json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
 logger = get_logger(__name__)
-test_data = TestData()
 
-SAMPLE_DATASET_CONTENT = [
+SAMPLE_DATASET_CONTENT: Final = (
     {
         "messages": [
             {
@@ -30,21 +38,27 @@ SAMPLE_DATASET_CONTENT = [
                 "content": "Machine learning is a branch of artificial intelligence that allows systems to learn and improve from experience without being explicitly programmed."
             }
         ]
-    }
-]
+    },
+)
+
+
+# Sample data in JSONL format, serialized once at import
+SAMPLE_DATASET_JSONL: Final[bytes] = b"".join(json_dumps(item) + b"\n" for item in SAMPLE_DATASET_CONTENT)
 
 
 async def create_test_dataset() -> Path:
     """Create a temporary test dataset file."""
     # Create test file in temp directory
     dataset_path = Path(get_config().temp_dir) / "test_dataset.jsonl"
+    dataset_path.write_bytes(SAMPLE_DATASET_JSONL)
+    return dataset_path
 
-    # Write sample data in JSONL format
-    with open(dataset_path, 'w', encoding='utf-8') as f:
-        for item in SAMPLE_DATASET_CONTENT:
-            f.write(json.dumps(item) + '\n')
 
-    return dataset_path
+def create_test_dataset_buffer() -> io.BytesIO:
+    """Create an in-memory test dataset, for uploads that don't need a file on disk."""
+    buffer = io.BytesIO(SAMPLE_DATASET_JSONL)
+    buffer.name = "test_dataset.jsonl"
+    return buffer
 
 
 async def test_dataset_operations(runner: 'TestRunner') -> None:
@@ -54,8 +68,8 @@ async def test_dataset_operations(runner: 'TestRunner') -> None:
     Tests:
     - Create test dataset file
     - Upload dataset
-    - List datasets
     - Get dataset details
+    - List datasets (thorough checks only)
     - Update dataset
     - Delete dataset
     - Verify dataset status changes
@@ -65,7 +79,7 @@ async def test_dataset_operations(runner: 'TestRunner') -> None:
     # Create test dataset file
     dataset_path = await create_test_dataset()
     dataset_name = sanitize_name(generate_test_name("test-dataset"))
-    logger.info(f"Created test dataset file: {dataset_path}")
+    logger.info("Created test dataset file: %s", dataset_path)
 
     # Upload dataset
     dataset = await runner.sdk.dataset.upload_dataset(
@@ -84,22 +98,24 @@ async def test_dataset_operations(runner: 'TestRunner') -> None:
 
     # Store dataset info for cleanup
     test_data.set('test_dataset_name', dataset_name)
-    logger.info(f"Uploaded dataset ({format_size(dataset.file_size)})")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Uploaded dataset (%s)", format_size(dataset.file_size))
 
-    # List datasets and verify our new dataset is present
-    datasets_response = await runner.sdk.dataset.list_datasets()
-    assert any(d.name == dataset_name for d in datasets_response.data), \
-        f"Uploaded dataset {dataset_name} not found in list response"
-
-    # Get specific dataset
+    # Get specific dataset to verify it is present
     dataset_info = await runner.sdk.dataset.get_dataset(dataset_name)
     assert dataset_info.name == dataset_name, "Dataset details name mismatch"
     assert dataset_info.status == DatasetStatus.UPLOADED, \
         f"Dataset not uploaded. Status: {dataset_info.status}"
 
+    if runner.config.thorough_checks:
+        # List datasets and verify our new dataset is present
+        datasets_response = await runner.sdk.dataset.list_datasets()
+        assert any(d.name == dataset_name for d in datasets_response.data), \
+            f"Uploaded dataset {dataset_name} not found in list response"
+
     # Update dataset
     new_description = "Updated test dataset description"
-    logger.info(f"Updating dataset description")
+    logger.info("Updating dataset description")
 
     updated_dataset = await runner.sdk.dataset.update_dataset(
         dataset_name,
@@ -111,7 +127,7 @@ async def test_dataset_operations(runner: 'TestRunner') -> None:
         f"Dataset description not updated. Expected: {new_description}, got: {updated_dataset.description}"
 
     # Delete dataset
-    logger.info(f"Deleting dataset: {dataset_name}")
+    logger.info("Deleting dataset: %s", dataset_name)
     await runner.sdk.dataset.delete_dataset(dataset_name)
 
     # Verify deletion by checking status
@@ -121,7 +137,7 @@ async def test_dataset_operations(runner: 'TestRunner') -> None:
             f"Dataset not marked as deleted. Status: {deleted_dataset.status}"
     except Exception as e:
         # Some APIs might return 404 for deleted datasets instead of status
-        logger.info(f"Dataset not accessible after deletion: {e}")
+        logger.info("Dataset not accessible after deletion: %s", e)
 
     # Clean up test file
     dataset_path.unlink()
@@ -132,33 +148,30 @@ async def cleanup_datasets(runner: 'TestRunner') -> None:
     """
     Clean up datasets created during testing.
     """
+    dataset_name = test_data.get('test_dataset_name')
+    if not dataset_name:
+        return
+
     try:
-        dataset_name = test_data.get('test_dataset_name')
-        if dataset_name:
-            try:
-                # Attempt to delete the dataset if it exists
-                await runner.sdk.dataset.delete_dataset(dataset_name)
-                logger.info(f"Deleted test dataset: {dataset_name}")
-            except Exception as e:
-                logger.warning(f"Error deleting dataset {dataset_name}: {e}")
+        # Attempt to delete the dataset if it exists
+        await runner.sdk.dataset.delete_dataset(dataset_name)
+        logger.info("Deleted test dataset: %s", dataset_name)
     except Exception as e:
-        logger.error(f"Error during dataset cleanup: {e}")
-        raise
+        logger.warning("Error deleting dataset %s: %s", dataset_name, e)
 
 
 if __name__ == "__main__":
     # For manual testing
-    from test_runner import TestRunner
+    from test_runner import get_shared_runner, close_shared_runner
 
 
     async def run_test():
-        runner = TestRunner()
+        runner = await get_shared_runner()
         try:
-            await runner.setup()
             await test_dataset_operations(runner)
         finally:
             await cleanup_datasets(runner)
-            await runner.cleanup()
+            await close_shared_runner()
 
 
     asyncio.run(run_test())
@@ -1,7 +1,8 @@
 import asyncio
 from typing import TYPE_CHECKING
 
-from test_datasets import create_test_dataset
+from test_datasets import create_test_dataset_buffer
+from test_models import list_base_models
 
 from logger import get_logger
 from lumino.api_sdk.models import (
@@ -12,13 +13,12 @@ from lumino.api_sdk.models import (
     FineTuningJobStatus,
     DatasetCreate
 )
-from utils import TestData, generate_test_name, sanitize_name, wait_for_condition
+from utils import test_data, generate_test_name, sanitize_name, wait_for_condition
 
 if TYPE_CHECKING:
     from test_runner import TestRunner
 
 logger = get_logger(__name__)
-test_data = TestData()
 
 
 async def test_fine_tuning_operations(runner: 'TestRunner') -> None:
@@ -26,7 +26,7 @@ async def test_fine_tuning_operations(runner: 'TestRunner') -> None:
     Test fine-tuning operations.
 
     Tests:
-    - List available base models
+    - Check the base model is available
     - Create dataset for fine-tuning
     - Create fine-tuning job
     - Monitor job progress
@@ -37,34 +37,33 @@ async def test_fine_tuning_operations(runner: 'TestRunner') -> None:
     """
     logger.info("Starting fine-tuning operations test")
 
-    # First, get available base models
-    models_response = await runner.sdk.model.list_base_models()
-    assert len(models_response.data) > 0, "No base models available"
-
     base_model = runner.config.fine_tuning_base_model
-    # See if the base model is available, except if it's "llm_dummy"
-    if base_model != "llm_dummy":
-        model_exists = any(m.name == base_model for m in models_response.data)
-        assert model_exists, f"Base model {base_model} not found in available models"
-    logger.info(f"Using base model: {base_model}")
-
-    # Create test dataset
     dataset_name = sanitize_name(generate_test_name("ft-dataset"))
-    dataset_path = await create_test_dataset()  # From test_datasets.py
-
-    await runner.sdk.dataset.upload_dataset(
-        str(dataset_path),
-        DatasetCreate(
-            name=dataset_name,
-            description="Dataset for fine-tuning test"
-        )
+    # Store the dataset name first so cleanup finds it even if the base model check fails
+    test_data.set('test_ft_dataset_name', dataset_name)
+
+    # Check the base model and upload the test dataset concurrently; they are independent.
+    # Wait for both before failing, so cleanup never races an upload still in flight.
+    results = await asyncio.gather(
+        check_base_model(runner, base_model),
+        runner.sdk.dataset.upload_dataset(
+            create_test_dataset_buffer(),  # From test_datasets.py
+            DatasetCreate(
+                name=dataset_name,
+                description="Dataset for fine-tuning test"
+            )
+        ),
+        return_exceptions=True
     )
-    test_data.set('test_dataset_name', dataset_name)
-    logger.info(f"Uploaded dataset: {dataset_name}")
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+    logger.info("Using base model: %s", base_model)
+    logger.info("Uploaded dataset: %s", dataset_name)
 
     # Create fine-tuning job
     job_name = sanitize_name(generate_test_name("ft-job"))
-    logger.info(f"Creating fine-tuning job: {job_name}")
+    logger.info("Creating fine-tuning job: %s", job_name)
 
     job = await runner.sdk.fine_tuning.create_fine_tuning_job(
         FineTuningJobCreate(
@@ -84,33 +83,28 @@ async def test_fine_tuning_operations(runner: 'TestRunner') -> None:
 
     # Store job info for cleanup
     test_data.set('test_job_name', job_name)
-    logger.info(f"Created fine-tuning job {job_name} with ID: {job.id}")
+    logger.info("Created fine-tuning job %s with ID: %s", job_name, job.id)
 
     if runner.config.run_with_scheduler:
         # Monitor job progress
         await monitor_job_progress(runner, job_name)
 
-    # List fine-tuning jobs and verify our job is present
-    jobs_response = await runner.sdk.fine_tuning.list_fine_tuning_jobs()
-    job_found = False
-    for listed_job in jobs_response.data:
-        if listed_job.name == job_name:
-            job_found = True
-            assert listed_job.base_model_name == base_model, \
-                "Base model name mismatch in job listing"
-            assert listed_job.dataset_name == dataset_name, \
-                "Dataset name mismatch in job listing"
-            break
-    assert job_found, f"Created job {job_name} not found in list response"
-
-    # Get detailed job information
+    # Get detailed job information and verify our job is present
     job_details = await runner.sdk.fine_tuning.get_fine_tuning_job(job_name)
+    assert job_details.base_model_name == base_model, "Base model name mismatch in job details"
+    assert job_details.dataset_name == dataset_name, "Dataset name mismatch in job details"
     assert job_details.parameters is not None, "Job parameters missing in details"
     assert job_details.parameters["batch_size"] == 2, "Job parameter mismatch"
 
+    if runner.config.thorough_checks:
+        # List fine-tuning jobs and verify our job is present
+        jobs_response = await runner.sdk.fine_tuning.list_fine_tuning_jobs()
+        assert any(j.name == job_name for j in jobs_response.data), \
+            f"Created job {job_name} not found in list response"
+
     # If job is still running, test cancellation
     if job_details.status == FineTuningJobStatus.RUNNING:
-        logger.info(f"Cancelling job {job_name}")
+        logger.info("Cancelling job %s", job_name)
         cancelled_job = await runner.sdk.fine_tuning.cancel_fine_tuning_job(job_name)
         assert cancelled_job.status in (FineTuningJobStatus.STOPPING, FineTuningJobStatus.STOPPED), \
             f"Job not cancelled. Status: {cancelled_job.status}"
@@ -121,15 +115,34 @@ async def test_fine_tuning_operations(runner: 'TestRunner') -> None:
         models = [m for m in models_response.data if m.fine_tuning_job_name == job_name]
         if models:
             test_data.set('test_model_name', models[0].name)
-            logger.info(f"Fine-tuned model created: {models[0].name}")
+            logger.info("Fine-tuned model created: %s", models[0].name)
 
     # Delete the job
-    logger.info(f"Deleting job {job_name}")
+    logger.info("Deleting job %s", job_name)
     await runner.sdk.fine_tuning.delete_fine_tuning_job(job_name)
 
     logger.info("Fine-tuning operations test completed successfully")
 
 
+async def check_base_model(runner: 'TestRunner', base_model: str) -> None:
+    """
+    Verify the base model is available, except if it's "llm_dummy".
+
+    Args:
+        runner: TestRunner instance
+        base_model: Name of the base model to check
+    """
+    if runner.config.thorough_checks:
+        models_response = await list_base_models(runner)  # From test_models.py
+        assert len(models_response.data) > 0, "No base models available"
+        if base_model != "llm_dummy":
+            model_exists = any(m.name == base_model for m in models_response.data)
+            assert model_exists, f"Base model {base_model} not found in available models"
+    elif base_model != "llm_dummy":
+        # Fails if the base model does not exist
+        await runner.sdk.model.get_base_model(base_model)
+
+
 async def monitor_job_progress(runner: 'TestRunner', job_name: str) -> None:
     """
     Monitor fine-tuning job progress until completion or timeout.
@@ -155,14 +168,14 @@ async def monitor_job_progress(runner: 'TestRunner', job_name: str) -> None:
 
         # Log progress if changed
         if job.status != last_status:
-            logger.info(f"Job status: {job.status}")
+            logger.info("Job status: %s", job.status)
             last_status = job.status
 
         if job.current_step != last_step and job.current_step is not None:
             progress = (job.current_step / job.total_steps * 100) if job.total_steps else 0
             logger.info(
-                f"Progress: {job.current_step}/{job.total_steps} steps "
-                f"({progress:.1f}%) - Epoch {job.current_epoch}/{job.total_epochs}"
+                "Progress: %s/%s steps (%.1f%%) - Epoch %s/%s",
+                job.current_step, job.total_steps, progress, job.current_epoch, job.total_epochs
             )
             last_step = job.current_step
 
@@ -175,7 +188,9 @@ async def monitor_job_progress(runner: 'TestRunner', job_name: str) -> None:
     await wait_for_condition(
         check_progress,
         timeout=120,  # 2 minutes should be enough for dummy job
-        interval=5.0,
+        interval=0.5,
+        backoff=2.0,
+        max_interval=5.0,
         message=f"Job {job_name} did not complete within 120 seconds"
     )
 
@@ -183,46 +198,47 @@ async def monitor_job_progress(runner: 'TestRunner', job_name: str) -> None:
 async def cleanup_fine_tuning(runner: 'TestRunner') -> None:
     """
     Clean up fine-tuning test temp files.
+    The job and dataset are independent, so they are deleted concurrently.
     """
     try:
+        cleanups = []
+
         # Clean up job
         job_name = test_data.get('test_job_name')
         if job_name:
-            try:
-                await runner.sdk.fine_tuning.delete_fine_tuning_job(job_name)
-                logger.info(f"Deleted test job: {job_name}")
-            except Exception as e:
-                logger.warning(f"Error deleting job {job_name}: {e}")
+            cleanups.append(("job", job_name, runner.sdk.fine_tuning.delete_fine_tuning_job(job_name)))
 
         # Clean up dataset
-        dataset_name = test_data.get('test_dataset_name')
+        dataset_name = test_data.get('test_ft_dataset_name')
         if dataset_name:
-            try:
-                await runner.sdk.dataset.delete_dataset(dataset_name)
-                logger.info(f"Deleted test dataset: {dataset_name}")
-            except Exception as e:
-                logger.warning(f"Error deleting dataset {dataset_name}: {e}")
+            cleanups.append(("dataset", dataset_name, runner.sdk.dataset.delete_dataset(dataset_name)))
+
+        results = await asyncio.gather(*[coro for _, _, coro in cleanups], return_exceptions=True)
+        for (kind, name, _), result in zip(cleanups, results):
+            if isinstance(result, Exception):
+                logger.warning("Error deleting %s %s: %s", kind, name, result)
+            else:
+                logger.info("Deleted test %s: %s", kind, name)
 
         # Note: Fine-tuned models are automatically cleaned up when the job is deleted
 
     except Exception as e:
-        logger.error(f"Error during fine-tuning cleanup: {e}")
+        logger.error("Error during fine-tuning cleanup: %s", e)
         raise
 
 
 if __name__ == "__main__":
     # For manual testing
-    from test_runner import TestRunner
+    from test_runner import get_shared_runner, close_shared_runner
 
 
     async def run_test():
-        runner = TestRunner()
+        runner = await get_shared_runner()
         try:
-            await runner.setup()
             await test_fine_tuning_operations(runner)
         finally:
             await cleanup_fine_tuning(runner)
-            await runner.cleanup()
+            await close_shared_runner()
 
 
     asyncio.run(run_test())
@@ -2,14 +2,19 @@ import asyncio
 from typing import TYPE_CHECKING
 
 from logger import get_logger
-from lumino.api_sdk.models import BaseModelStatus, FineTunedModelStatus
-from utils import TestData
+from lumino.api_sdk.models import BaseModelStatus, FineTunedModelStatus, ListResponse
+from utils import test_data, memoized_async
 
 if TYPE_CHECKING:
     from test_runner import TestRunner
 
 logger = get_logger(__name__)
-test_data = TestData()
+
+
+@memoized_async
+async def list_base_models(runner: 'TestRunner') -> ListResponse:
+    """List the available base models once per test run."""
+    return await runner.sdk.model.list_base_models()
 
 
 async def test_model_operations(runner: 'TestRunner') -> None:
@@ -25,7 +30,7 @@ async def test_model_operations(runner: 'TestRunner') -> None:
     logger.info("Starting model operations test")
 
     # List base models
-    base_models = await runner.sdk.model.list_base_models()
+    base_models = await list_base_models(runner)
     assert len(base_models.data) > 0, "No base models available"
 
     # Store first active model for other tests
@@ -61,16 +66,15 @@ async def test_model_operations(runner: 'TestRunner') -> None:
 
 if __name__ == "__main__":
     # For manual testing
-    from test_runner import TestRunner
+    from test_runner import get_shared_runner, close_shared_runner
 
 
     async def run_test():
-        runner = TestRunner()
+        runner = await get_shared_runner()
         try:
-            await runner.setup()
             await test_model_operations(runner)
         finally:
-            await runner.cleanup()
+            await close_shared_runner()
 
 
     asyncio.run(run_test())
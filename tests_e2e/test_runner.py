@@ -1,6 +1,5 @@
 import asyncio
-import random
-import string
+import secrets
 import sys
 import time
 from dataclasses import dataclass
@@ -9,6 +8,8 @@ from typing import Callable, Awaitable, List, Optional
 
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
+from rich.table import Table
+from rich.text import Text
 
 from config import get_config, Config
 from logger import get_logger
@@ -21,6 +22,7 @@ console = Console()
 @dataclass
 class TestResult:
     """Represents the result of a single test."""
+    __test__ = False  # Not a pytest test class
     name: str
     success: bool
     error: Optional[Exception] = None
@@ -37,6 +39,7 @@ class TestResult:
 
 class TestRunner:
     """Main test orchestration class."""
+    __test__ = False  # Not a pytest test class
 
     def __init__(self):
         self.config: Config = get_config()
@@ -47,8 +50,7 @@ class TestRunner:
     @staticmethod
     def _generate_run_id(length: int = 8) -> str:
         """Generate a unique test run identifier."""
-        chars = string.ascii_lowercase + string.digits
-        return ''.join(random.choice(chars) for _ in range(length))
+        return secrets.token_hex((length + 1) // 2)[:length]
 
     @staticmethod
     def _format_error(error: Exception) -> str:
@@ -63,18 +65,18 @@ class TestRunner:
         """Run a single test with progress tracking."""
         test_name = test_func.__name__
         task = progress.add_task(f"Running {test_name}...", total=None)
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         try:
             await test_func(self)
             success = True
             error = None
         except Exception as e:
-            logger.exception(f"Test {test_name} failed")
+            logger.exception("Test %s failed", test_name)
             success = False
             error = e
         finally:
-            duration = time.time() - start_time
+            duration = time.perf_counter() - start_time
             progress.remove_task(task)
 
         return TestResult(test_name, success, error, duration)
@@ -85,18 +87,28 @@ class TestRunner:
         passed = sum(1 for r in self.results if r.success)
         failed = total - passed
 
-        console.print("=== Test Results ===")
-        console.print(f"Run ID: {self._test_run_id}")
-        console.print(f"Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        console.print(f"Total: {total}, Passed: {passed}, Failed: {failed}\n")
+        table = Table(
+            title="=== Test Results ===",
+            caption=(
+                f"Run ID: {self._test_run_id}, Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+                f"Total: {total}, Passed: {passed}, Failed: {failed}"
+            )
+        )
+        table.add_column("Status")
+        table.add_column("Name")
+        table.add_column("Duration", justify="right")
+        table.add_column("Error")
 
-        # Print individual test results
+        # Add individual test results; Text avoids parsing error messages as markup
         for result in self.results:
-            color = "green" if result.success else "red"
-            status_str = f"[{color}]{result.status_str}[/{color}]"
-            console.print(f"{status_str} {result.name} ({result.duration_str})")
-            if result.error:
-                console.print(f"  [red]Error: {self._format_error(result.error)}[/red]")
+            table.add_row(
+                Text(result.status_str, style="green" if result.success else "red"),
+                result.name,
+                result.duration_str,
+                Text(self._format_error(result.error) if result.error else "", style="red")
+            )
+
+        console.print(table)
 
     async def setup(self) -> None:
         """Initialize test environment."""
@@ -107,6 +119,9 @@ class TestRunner:
         self.sdk = LuminoSDK(self.config.api_key, self.config.api_url)
         await self.sdk.__aenter__()
 
+        # Validate the API key early and open a pooled connection before tests run concurrently
+        await self.sdk.user.get_current_user()
+
     async def cleanup(self) -> None:
         """Cleanup test environment."""
         if self.sdk:
@@ -134,15 +149,12 @@ class TestRunner:
 
             console.print("=== Running tests ===")
 
-            # Define test sequence
-            tests = [
-                test_user_operations,
-                test_api_key_operations,
-                test_dataset_operations,
-                test_model_operations,
-                test_fine_tuning_operations,
-                test_usage_operations,
-                test_billing_operations
+            # Define test stages; tests within a stage are independent and run concurrently
+            stages = [
+                [test_user_operations, test_api_key_operations],
+                [test_dataset_operations, test_model_operations, test_usage_operations, test_billing_operations],
+                # Fine-tuning may consume credits, so it runs after the billing test
+                [test_fine_tuning_operations]
             ]
 
             # Create progress display
@@ -155,9 +167,9 @@ class TestRunner:
 
             # Run tests
             with progress:
-                for test in tests:
-                    result = await self._run_test(test, progress)
-                    self.results.append(result)
+                for stage in stages:
+                    results = await asyncio.gather(*[self._run_test(test, progress) for test in stage])
+                    self.results.extend(results)
 
             # Print results
             self.print_results()
@@ -170,7 +182,46 @@ class TestRunner:
             return False
 
         finally:
-            await self.cleanup()
+            # Let the session close even if the run is cancelled
+            await asyncio.shield(self.cleanup())
+
+
+# TestRunner shared by everything in the current process, see get_shared_runner()
+_shared_runner: Optional[TestRunner] = None
+_shared_runner_lock = asyncio.Lock()
+
+
+async def get_shared_runner() -> TestRunner:
+    """
+    Get the TestRunner shared by this process, setting it up on first use.
+
+    Reusing one runner keeps a single SDK session (and its warm connection pool)
+    across test modules.
+
+    Returns:
+        TestRunner: The set up shared runner
+    """
+    global _shared_runner
+    async with _shared_runner_lock:
+        if _shared_runner is None:
+            runner = TestRunner()
+            try:
+                await runner.setup()
+            except BaseException:
+                await asyncio.shield(runner.cleanup())
+                raise
+            _shared_runner = runner
+    return _shared_runner
+
+
+async def close_shared_runner() -> None:
+    """Clean up the shared TestRunner, if one was created."""
+    global _shared_runner
+    async with _shared_runner_lock:
+        if _shared_runner is not None:
+            runner, _shared_runner = _shared_runner, None
+            # Shielded so a cancelled caller does not leave the SDK session open
+            await asyncio.shield(runner.cleanup())
 
 
 async def main() -> int:
@@ -4,13 +4,12 @@ from typing import TYPE_CHECKING
 
 from logger import get_logger
 from lumino.api_sdk.models import ServiceName, UsageUnit
-from utils import TestData
+from utils import test_data
 
 if TYPE_CHECKING:
     from test_runner import TestRunner
 
 logger = get_logger(__name__)
-test_data = TestData()
 
 
 async def test_usage_operations(runner: 'TestRunner') -> None:
@@ -73,16 +72,15 @@ async def test_usage_operations(runner: 'TestRunner') -> None:
 
 if __name__ == "__main__":
     # For manual testing
-    from test_runner import TestRunner
+    from test_runner import get_shared_runner, close_shared_runner
 
 
     async def run_test():
-        runner = TestRunner()
+        runner = await get_shared_runner()
         try:
-            await runner.setup()
             await test_usage_operations(runner)
         finally:
-            await runner.cleanup()
+            await close_shared_runner()
 
 
     asyncio.run(run_test())
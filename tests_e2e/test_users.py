@@ -3,13 +3,12 @@ from typing import TYPE_CHECKING
 
 from logger import get_logger
 from lumino.api_sdk.models import UserStatus, UserUpdate
-from utils import TestData, generate_test_name, sanitize_name
+from utils import test_data, generate_test_name, sanitize_name
 
 if TYPE_CHECKING:
     from test_runner import TestRunner
 
 logger = get_logger(__name__)
-test_data = TestData()
 
 
 async def test_user_operations(runner: 'TestRunner') -> None:
@@ -23,9 +22,9 @@ async def test_user_operations(runner: 'TestRunner') -> None:
     """
     logger.info("Starting user operations test")
 
-    # Store the original user information
+    # Store the original user information; keep the first one seen if the test is rerun
     user = await runner.sdk.user.get_current_user()
-    test_data.set('original_user', user)
+    test_data.setdefault('original_user', user)
 
     logger.info(f"Current user: {user.email}")
     assert user.status == UserStatus.ACTIVE, f"User status is {user.status}, expected ACTIVE"
@@ -35,26 +34,19 @@ async def test_user_operations(runner: 'TestRunner') -> None:
     new_name = sanitize_name(generate_test_name("test-user"))
     logger.info(f"Updating user name to: {new_name}")
 
+    # Store test resources for cleanup before the update, so a failed check still restores the name
+    test_data.set('test_user_name', new_name)
+
     updated_user = await runner.sdk.user.update_current_user(
         UserUpdate(name=new_name)
     )
 
-    # Verify update was successful
+    # Verify update was successful; the update returns the stored user, so no extra GET is needed
     assert updated_user.name == new_name, (
         f"User name not updated correctly. "
         f"Expected: {new_name}, got: {updated_user.name}"
     )
 
-    # Get user again to verify persistence
-    current_user = await runner.sdk.user.get_current_user()
-    assert current_user.name == new_name, (
-        f"User name update not persisted. "
-        f"Expected: {new_name}, got: {current_user.name}"
-    )
-
-    # Store test resources for cleanup
-    test_data.set('test_user_name', new_name)
-
     logger.info("User operations test completed successfully")
 
 
@@ -77,17 +69,16 @@ async def cleanup_user_operations(runner: 'TestRunner') -> None:
 
 if __name__ == "__main__":
     # For manual testing
-    from test_runner import TestRunner
+    from test_runner import get_shared_runner, close_shared_runner
 
 
     async def run_test():
-        runner = TestRunner()
+        runner = await get_shared_runner()
         try:
-            await runner.setup()
             await test_user_operations(runner)
         finally:
             await cleanup_user_operations(runner)
-            await runner.cleanup()
+            await close_shared_runner()
 
 
     asyncio.run(run_test())
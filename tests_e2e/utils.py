@@ -1,38 +1,85 @@
 import asyncio
+import os
 import random
 import re
 import string
+import threading
 import time
-from datetime import datetime
 from functools import wraps
 from typing import Any, Callable, TypeVar, ParamSpec
+from uuid import UUID
 
 from logger import get_logger
+from lumino.api_sdk.exceptions import LuminoServerError
 
 logger = get_logger(__name__)
 
 P = ParamSpec('P')
 T = TypeVar('T')
 
+# Units used by format_size
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
+# Client error statuses that are still worth retrying (timeout, rate limit)
+_RETRYABLE_CLIENT_STATUSES = frozenset({408, 429})
+
+# Characters used for the random suffix in generate_test_name
+_ALPHABET = string.ascii_lowercase + string.digits
+
+# Runs of characters (including hyphens) that sanitize_name replaces with one hyphen
+_INVALID_NAME_RUN = re.compile(r'[^a-z0-9]+')
+
+
+def is_retryable_error(error: Exception) -> bool:
+    """
+    Check whether a failed call is worth retrying.
+
+    Client errors (4xx) returned by the API are deterministic, so they are not
+    retried, except for request timeouts and rate limiting.
+
+    Args:
+        error: Exception raised by the failed call
+
+    Returns:
+        True if the call should be retried
+    """
+    if isinstance(error, LuminoServerError) and 400 <= error.status < 500:
+        return error.status in _RETRYABLE_CLIENT_STATUSES
+    return True
+
 
 def retry(
         max_attempts: int = 3,
         delay: float = 1.0,
         backoff: float = 2.0,
-        exceptions: tuple = (Exception,)
+        exceptions: tuple = (Exception,),
+        cap: float = 30.0,
+        should_retry: Callable[[Exception], bool] | None = is_retryable_error
 ) -> Callable[[Callable[P, T]], Callable[P, T]]:
     """
-    Retry decorator with exponential backoff.
+    Retry decorator with jittered exponential backoff.
+
+    Every delay, including the first, is drawn between the initial delay and the
+    previous delay times backoff (decorrelated jitter), so callers failing together
+    do not retry in lockstep.
 
     Args:
         max_attempts: Maximum number of retry attempts
         delay: Initial delay between retries in seconds
-        backoff: Multiplier for delay after each retry
+        backoff: Upper bound multiplier for delay after each retry
         exceptions: Tuple of exceptions to catch and retry
+        cap: Maximum delay between retries in seconds
+        should_retry: Predicate deciding whether a caught exception is retried;
+            None retries every caught exception
 
     Returns:
         Decorated function that will retry on specified exceptions
+
+    Raises:
+        ValueError: If max_attempts is less than 1
     """
+    if max_attempts < 1:
+        raise ValueError("max_attempts must be >= 1")
 
     def decorator(func: Callable[P, T]) -> Callable[P, T]:
         @wraps(func)
@@ -44,19 +91,81 @@ def retry(
                 except exceptions as e:
                     if attempt == max_attempts - 1:  # Last attempt
                         raise  # Re-raise the last exception
+                    if should_retry is not None and not should_retry(e):
+                        raise
+                    current_delay = min(cap, random.uniform(delay, current_delay * backoff))
                     logger.warning(
                         f"Attempt {attempt + 1}/{max_attempts} failed: {str(e)}"
                         f"Retrying in {current_delay:.1f} seconds..."
                     )
-                    time.sleep(current_delay)
-                    current_delay *= backoff
-            return await func(*args, **kwargs)  # Final attempt
+                    await asyncio.sleep(current_delay)
 
         return wrapper
 
     return decorator
 
 
+def _loop_lock(key: str) -> asyncio.Lock:
+    """
+    Get the lock stored under key for the running event loop.
+
+    asyncio locks bind to the loop that first waits on them, so a lock left by
+    an earlier loop is replaced instead of reused.
+    """
+    loop = asyncio.get_running_loop()
+    with _lock:
+        owner, lock = _data.get(key, (None, None))
+        if owner is not loop:
+            lock = asyncio.Lock()
+            _data[key] = (loop, lock)
+        return lock
+
+
+def memoized_async(func: Callable[P, T] | None = None, *, name: str | None = None):
+    """
+    Cache the result of an idempotent coroutine for the current test data scope.
+
+    Results are keyed on the call arguments and kept in the shared TestData store
+    under the given name (the function's qualified name by default), so every
+    test module sees the same hits however it imported the function, and
+    td_clear() drops them. Only use this for read-only requests.
+
+    Args:
+        func: Coroutine function to memoize; its arguments must be hashable
+        name: Name of the cache, for functions whose qualified names clash
+
+    Returns:
+        Decorated function that awaits func at most once per distinct arguments
+    """
+
+    def decorator(func: Callable[P, T]) -> Callable[P, T]:
+        cache_key = f"memoized:{name or func.__qualname__}"
+        lock_key = f"{cache_key}:lock"
+
+        @wraps(func)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+            key = (args, tuple(sorted(kwargs.items())))
+            cache = td_setdefault(cache_key, {})
+            if key in cache:
+                return cache[key]
+            async with _loop_lock(lock_key):
+                # Another caller may have filled the entry while we waited
+                cache = td_setdefault(cache_key, {})
+                if key not in cache:
+                    cache[key] = await func(*args, **kwargs)
+                return cache[key]
+
+        wrapper.cache_clear = lambda: td_set(cache_key, {})
+        return wrapper
+
+    return decorator if func is None else decorator(func)
+
+
+def _suffix(length: int = 5) -> str:
+    """Return a random lowercase alphanumeric string of the given length."""
+    return ''.join(_ALPHABET[b % len(_ALPHABET)] for b in os.urandom(length))
+
+
 def generate_test_name(prefix: str = "test") -> str:
     """
     Generate a unique test resource name with timestamp and random suffix.
@@ -68,9 +177,7 @@ def generate_test_name(prefix: str = "test") -> str:
         Generated name in format: prefix-YYYYMMDD-HHMMSS-XXXXX
         where XXXXX is a random string
     """
-    timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
-    suffix = ''.join(random.choices(string.ascii_lowercase + string.digits, k=5))
-    return f"{prefix}-{timestamp}-{suffix}"
+    return f"{prefix}-{time.strftime('%Y%m%d-%H%M%S')}-{_suffix()}"
 
 
 def sanitize_name(name: str) -> str:
@@ -83,14 +190,8 @@ def sanitize_name(name: str) -> str:
     Returns:
         Sanitized name with only lowercase letters, numbers, and hyphens
     """
-    # Convert to lowercase and replace spaces/special chars with hyphens
-    name = name.lower()
-    name = re.sub(r'[^a-z0-9-]', '-', name)
-    # Remove consecutive hyphens
-    name = re.sub(r'-+', '-', name)
-    # Remove leading/trailing hyphens
-    name = name.strip('-')
-    return name
+    # Lowercase, replace each run of special chars or hyphens with one hyphen and strip the ends
+    return _INVALID_NAME_RUN.sub('-', name.lower()).strip('-')
 
 
 def format_size(size_bytes: int) -> str:
@@ -103,39 +204,46 @@ def format_size(size_bytes: int) -> str:
     Returns:
         Formatted string (e.g., "1.23 MB")
     """
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-        if size_bytes < 1024:
-            return f"{size_bytes:.2f} {unit}"
-        size_bytes /= 1024
-    return f"{size_bytes:.2f} PB"
+    if size_bytes < 1024:
+        return f"{size_bytes:.2f} B"
+    # Each unit is 2**10 times the previous one; int() also accepts float sizes
+    exponent = min((int(size_bytes).bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+    return f"{size_bytes / (1 << (exponent * 10)):.2f} {_SIZE_UNITS[exponent]}"
 
 
 async def wait_for_condition(
         condition: Callable,
         timeout: float = None,
         interval: float = 1.0,
-        message: str = "Condition not met"
+        message: str = "Condition not met",
+        backoff: float = 1.0,
+        max_interval: float = None
 ) -> None:
     """
     Wait for a condition to be met with timeout.
 
     Args:
         condition: Function that returns True when condition is met
-        timeout: Maximum time to wait in seconds (None for config default)
-        interval: Time between checks in seconds
+        timeout: Maximum time to wait in seconds (None to wait indefinitely)
+        interval: Initial time between checks in seconds
         message: Error message if timeout is reached
+        backoff: Multiplier for the interval after each check
+        max_interval: Upper bound for the interval in seconds (None for no limit)
 
     Raises:
         TimeoutError: If condition is not met within timeout period
     """
-    start_time = time.time()
+    deadline = time.monotonic() + timeout if timeout is not None else None
     while True:
         r = await condition()
         if r:
             return
-        if time.time() - start_time > timeout:
+        if deadline is not None and time.monotonic() > deadline:
             raise TimeoutError(f"{message} within {timeout} seconds")
         await asyncio.sleep(interval)
+        interval *= backoff
+        if max_interval is not None:
+            interval = min(interval, max_interval)
 
 
 def is_valid_uuid(uuid_str: str) -> bool:
@@ -148,40 +256,63 @@ def is_valid_uuid(uuid_str: str) -> bool:
     Returns:
         True if string is a valid UUID, False otherwise
     """
-    uuid_pattern = re.compile(
-        r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$'
-    )
-    return bool(uuid_pattern.match(uuid_str.lower()))
+    try:
+        # Only accept the canonical 8-4-4-4-12 form, not braces, URNs or bare hex
+        return str(UUID(uuid_str)) == uuid_str.lower()
+    except (ValueError, AttributeError, TypeError):
+        return False
 
 
-class TestData:
-    """
-    Class to store and manage test data between test cases.
-    Thread-safe singleton to share data across test modules.
-    """
-    _instance = None
-    _data: dict[str, Any] = {}
+# Test data shared between test cases and test modules
+_data: dict[str, Any] = {}
+_lock = threading.Lock()
+
+
+def td_set(key: str, value: Any) -> None:
+    """Set a test data value."""
+    with _lock:
+        _data[key] = value
+
 
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-        return cls._instance
+def td_setdefault(key: str, value: Any) -> Any:
+    """Set a test data value unless the key is already set, and return the stored value."""
+    with _lock:
+        return _data.setdefault(key, value)
 
-    def set(self, key: str, value: Any) -> None:
-        """Set a test data value."""
-        self._data[key] = value
 
-    def get(self, key: str, default: Any = None) -> Any:
-        """Get a test data value."""
-        return self._data.get(key, default)
+def td_get(key: str, default: Any = None) -> Any:
+    """Get a test data value."""
+    with _lock:
+        return _data.get(key, default)
 
-    def clear(self) -> None:
-        """Clear all test data."""
-        self._data.clear()
+
+def td_clear() -> None:
+    """Clear all test data."""
+    with _lock:
+        _data.clear()
+
+
+class TestData:
+    """
+    Object interface to the shared test data.
+    Kept for existing callers; all instances share the module-level store.
+    """
+    __test__ = False  # Not a pytest test class
+    __slots__ = ()
+
+    set = staticmethod(td_set)
+    setdefault = staticmethod(td_setdefault)
+    get = staticmethod(td_get)
+    clear = staticmethod(td_clear)
 
     def __contains__(self, key: str) -> bool:
         """Check if key exists in test data."""
-        return key in self._data
+        with _lock:
+            return key in _data
+
+
+# Test data shared by all test modules
+test_data = TestData()
 
 
 if __name__ == "__main__":
@@ -196,6 +327,5 @@ if __name__ == "__main__":
     print(f"Formatted size: {size}")
 
     # Test data example
-    test_data = TestData()
     test_data.set("user_id", "123")
     print(f"Test data: {test_data.get('user_id')}")